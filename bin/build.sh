@@ -34,10 +34,26 @@ function make_pdf {
 
 function make_packet {
     pdfs=""
+    # Songs are independent, so build them concurrently. Each pdflatex run
+    # writes its own <stem>.aux/.log/.pdf, so sharing an output dir is fine.
+    # Per-song pdflatex output only goes to those .log files.
+    typeset -A pids
     while read p; do
-        make_pdf "songs/$p.tex"
+        make_pdf "songs/$p.tex" > /dev/null &
+        pids[$!]=$p
     done < <(grep includepdf $1 | grep build/pdf | sed -E 's/.*{build\/pdf\/([^}]*)\.pdf}.*/\1/')
 
+    failed=0
+    for pid in ${(k)pids}; do
+        if ! wait $pid; then
+            echo "make_pdf failed: ${pids[$pid]} (see $SONGS_HOME/build/pdf/${pids[$pid]}.log)" >&2
+            failed=1
+        fi
+    done
+    if [ $failed -ne 0 ]; then
+        return 1
+    fi
+
     mkdir -p "build/packets"
     pdflatex \
        -interaction=nonstopmode \